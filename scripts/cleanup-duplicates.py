@@ -15,65 +15,351 @@ Features:
 - Handles edge cases safely (won't delete if only one copy exists)
 - Provides detailed logging of all actions
 - Supports dry-run mode for testing
+- Removes duplicates in bulk requests over a shared, rate-limited connection
+  pool, falling back to concurrent one-by-one removal (--workers)
 
 Author: Brainarr Plugin Team
 Version: 1.0.0
 """
 
 import argparse
+import functools
+import itertools
 import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
 from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     safe_print("❌ Error: requests library not found. Install with: pip install requests")
     sys.exit(1)
 
+try:
+    import ijson  # Optional: stream-parse the artist list instead of loading it whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Optional: faster decoding of JSON responses
+except ImportError:
+    orjson = None
+
+# Artist fields used by duplicate detection and reporting; the rest of each
+# (large) artist record, album list included, is dropped as soon as it is
+# parsed. Reporting only needs the album count, kept as '_album_count'.
+ARTIST_FIELDS = ('id', 'artistName', 'monitored')
+
+# Artists removed per bulk artist-editor request
+BULK_DELETE_BATCH_SIZE = 100
+
+# Where the artist list is cached between runs (revalidated with its ETag)
+ARTIST_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.brainarr')
+
+
+def _decode_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _iter_json_array(stream: BinaryIO) -> Iterable[Dict]:
+    """Iterate the items of a JSON array read from a binary stream."""
+    if ijson is not None:
+        # Plain floats, like json/orjson produce, rather than slower Decimals
+        return ijson.items(stream, 'item', use_float=True)
+    data = stream.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_file_atomic(path: str, chunks: Iterable[bytes]) -> None:
+    """Write chunks to a temporary file beside path, then swap it into place."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class _CachingReader:
+    """
+    Binary reader that copies everything read from a source stream to a file.
+
+    The copy goes to a temporary file beside ``path`` and is only swapped
+    into place by commit(), so an interrupted read never leaves a partial
+    cache behind. Write errors stop the copy instead of failing the read.
+    """
+
+    def __init__(self, source: BinaryIO, path: str):
+        self.source = source
+        self.path = path
+        self.tmp_path = f"{path}.{os.getpid()}.tmp"
+        self.sink = open(self.tmp_path, 'wb')
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.source.read(size if size >= 0 else None)
+        if self.sink is not None and data:
+            try:
+                self.sink.write(data)
+            except OSError as e:
+                logging.warning("Artist cache disabled: %s", e)
+                self.discard()
+        return data
+
+    def commit(self) -> bool:
+        """Read the rest of the source, then move the copy into place."""
+        while self.read(64 * 1024):
+            pass
+        if self.sink is None:
+            return False
+
+        try:
+            self.sink.close()
+            self.sink = None
+            os.replace(self.tmp_path, self.path)
+            return True
+        except OSError as e:
+            logging.warning("Artist cache disabled: %s", e)
+            return False
+        finally:
+            self.discard()
+
+    def discard(self) -> None:
+        """Drop the copy made so far."""
+        if self.sink is not None:
+            try:
+                self.sink.close()
+            except OSError:
+                pass
+            self.sink = None
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+    def __enter__(self) -> '_CachingReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.discard()
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how fast API calls are issued."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Reserve the token up front; a negative balance is the wait owed
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
+
 
 class LidarrAPI:
     """Lidarr API client for managing artists and albums."""
 
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, cache_dir: Optional[str] = None, pool_size: int = 16):
         self.base_url = base_url.rstrip('/')
+        self.api_url = f"{self.base_url}/api/v1/"
         self.api_key = api_key
+
+        # On-disk copy of the artist list; disabled when cache_dir is None
+        self.cache_path = os.path.join(cache_dir, 'lidarr-artists.cache.json') if cache_dir else None
+        self.cache_meta_path = os.path.join(cache_dir, 'lidarr-artists.cache.meta.json') if cache_dir else None
+
         self.session = requests.Session()
         self.session.headers.update({
             'X-Api-Key': api_key,
             'Content-Type': 'application/json'
         })
 
+        # Keep one pooled connection per concurrent caller so connections are
+        # reused rather than discarded when the pool is full, and retry
+        # transient server errors with exponential backoff. Throttled (429)
+        # responses wait exactly as long as Retry-After asks before retrying.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'DELETE']),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make API request with error handling."""
-        url = urljoin(f"{self.base_url}/api/v1/", endpoint)
+        if endpoint.startswith(('http://', 'https://')):
+            url = endpoint
+        else:
+            url = self.api_url + endpoint.lstrip('/')
 
         try:
             response = self.session.request(method, url, timeout=360, **kwargs)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
-            logging.error(f"API request failed: {method} {url} - {e}")
+            logging.error("API request failed: %s %s - %s", method, url, e)
             raise
 
+    def invalidate_artist_cache(self) -> None:
+        """Stop trusting the cached artist list, e.g. once artists are removed."""
+        if not self.cache_meta_path:
+            return
+        try:
+            os.remove(self.cache_meta_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning("Failed to invalidate artist cache: %s", e)
+
+    def _load_cache_meta(self) -> Dict:
+        """Return validators for the cached artist list, or {} if unusable."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+
+        try:
+            with open(self.cache_meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        # Never revalidate against a cache written for another Lidarr instance
+        return meta if meta.get('url') == self.base_url else {}
+
+    def _start_cache(self, response: requests.Response) -> Optional[_CachingReader]:
+        """Return a reader that saves the artist list body as it is parsed."""
+        if not self.cache_path:
+            return None
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            # Drop the old validators first so a half-written update is never trusted
+            if os.path.exists(self.cache_meta_path):
+                os.remove(self.cache_meta_path)
+            return _CachingReader(response.raw, self.cache_path)
+        except OSError as e:
+            logging.warning("Artist cache disabled: %s", e)
+            return None
+
+    def _finish_cache(self, cache: _CachingReader, response: requests.Response) -> None:
+        """Store a fully parsed artist list body and its validators."""
+        if not cache.commit():
+            return
+
+        meta = {
+            'url': self.base_url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        try:
+            _write_file_atomic(self.cache_meta_path, [json.dumps(meta).encode('utf-8')])
+        except OSError as e:
+            logging.warning("Artist cache disabled: %s", e)
+
+    def iter_artists(self, max_age: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Yield all artists from Lidarr as they are received.
+
+        The v1 artist endpoint has no paging parameters (page/pageSize are
+        ignored), so the library is always returned in a single response.
+        With ijson installed the body is parsed incrementally, and only
+        ARTIST_FIELDS plus the album count are kept from each artist.
+
+        When caching is enabled the body is saved to disk along with any
+        ETag/Last-Modified; later runs send them back and reuse the cached
+        copy when Lidarr answers 304 Not Modified. If ``max_age`` is given
+        and the cache was downloaded or revalidated within that many
+        seconds, it is used without contacting Lidarr at all.
+        """
+        meta = self._load_cache_meta()
+        if meta and max_age and time.time() - os.path.getmtime(self.cache_path) < max_age:
+            safe_log("♻️  Using artist list cached within the last %gs", max_age)
+            count = 0
+            with open(self.cache_path, 'rb') as source:
+                for artist in _iter_json_array(source):
+                    count += 1
+                    yield self._slim_artist(artist)
+            safe_log("✅ Retrieved %d artists", count)
+            return
+
+        safe_log("📡 Fetching all artists from Lidarr...")
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        count = 0
+        cache = None
+
+        with self._make_request('GET', 'artist', stream=True, headers=headers) as response:
+            if response.status_code == 304:
+                safe_log("♻️  Artist list unchanged since last run, using cached copy")
+                # Revalidated: restart the max_age freshness window
+                try:
+                    os.utime(self.cache_path)
+                except OSError as e:
+                    logging.warning("Failed to refresh artist cache: %s", e)
+                source = open(self.cache_path, 'rb')
+            else:
+                # Let urllib3 undo any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                cache = self._start_cache(response)
+                source = cache or response.raw
+
+            with source:
+                for artist in _iter_json_array(source):
+                    count += 1
+                    yield self._slim_artist(artist)
+                if cache is not None:
+                    self._finish_cache(cache, response)
+
+        safe_log("✅ Retrieved %d artists", count)
+
+    @staticmethod
+    def _slim_artist(artist: Dict) -> Dict:
+        """Keep only ARTIST_FIELDS and the album count from a parsed artist."""
+        record = {field: artist[field] for field in ARTIST_FIELDS if field in artist}
+        record['_album_count'] = len(artist.get('albums') or ())
+        return record
+
     def get_artists(self) -> List[Dict]:
         """Get all artists from Lidarr."""
-        safe_log("📡 Fetching all artists from Lidarr...")
-        response = self._make_request('GET', 'artist')
-        artists = response.json()
-        safe_log(f"✅ Retrieved {len(artists)} artists")
-        return artists
+        return list(self.iter_artists())
 
     def get_artist_albums(self, artist_id: int) -> List[Dict]:
         """Get all albums for a specific artist."""
         response = self._make_request('GET', f'album?artistId={artist_id}')
-        return response.json()
+        return _decode_json(response)
 
     def delete_artist(self, artist_id: int, delete_files: bool = False, add_import_exclusion: bool = True) -> bool:
         """Delete an artist from Lidarr."""
@@ -86,139 +372,203 @@ class LidarrAPI:
             response = self._make_request('DELETE', f'artist/{artist_id}', params=params)
             return response.status_code == 200
         except Exception as e:
-            logging.error(f"Failed to delete artist {artist_id}: {e}")
+            logging.error("Failed to delete artist %s: %s", artist_id, e)
+            return False
+
+    def delete_artists_bulk(self, artist_ids: List[int], delete_files: bool = False,
+                            add_import_exclusion: bool = True) -> bool:
+        """Delete several artists from Lidarr with a single artist editor request."""
+        body = {
+            'artistIds': artist_ids,
+            'deleteFiles': delete_files,
+            'addImportListExclusion': add_import_exclusion
+        }
+
+        try:
+            response = self._make_request('DELETE', 'artist/editor', json=body)
+            return response.ok
+        except Exception as e:
+            logging.error("Failed to bulk delete %d artists: %s", len(artist_ids), e)
             return False
 
     def test_connection(self) -> bool:
         """Test connection to Lidarr API."""
         try:
             response = self._make_request('GET', 'system/status')
-            status = response.json()
-            safe_log(f"✅ Connected to Lidarr {status.get('version', 'unknown')} - {status.get('instanceName', 'Lidarr')}")
+            status = _decode_json(response)
+            safe_log("✅ Connected to Lidarr %s - %s",
+                     status.get('version', 'unknown'), status.get('instanceName', 'Lidarr'))
             return True
         except Exception as e:
-            safe_log(f"❌ Failed to connect to Lidarr: {e}", 'error')
+            safe_log("❌ Failed to connect to Lidarr: %s", e, level='error')
             return False
 
 
-class DuplicateDetector:
-    """Detects duplicate artists with various matching strategies."""
+# Character folding applied during normalization: fullwidth forms become
+# their ASCII equivalents, Unicode dashes become '-', and quotes (ASCII,
+# typographic and fullwidth) are stripped
+_FOLD_TABLE = {
+    **{code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)},
+    0x3000: ' ',
+    **dict.fromkeys(map(ord, '‐‑‒–—―−'), '-'),
+    **dict.fromkeys(map(ord, '"\'‘’“”„＂＇'), None),
+}
 
-    # Pattern to match numbered duplicates: "Artist (2)", "Artist (3)", etc.
-    DUPLICATE_PATTERN = re.compile(r'^(.+?)\s*\((\d+)\)$')
 
-    @staticmethod
-    def normalize_name(name: str) -> str:
-        """Normalize artist name for matching."""
-        if not name:
-            return ""
+@functools.lru_cache(maxsize=1_000_000)
+def _normalize_name(name: str) -> str:
+    """Normalize artist name for matching (memoized; names repeat across passes)."""
+    if not name:
+        return ""
 
-        # Convert to lowercase and strip
-        normalized = name.lower().strip()
+    # Lowercase and fold width/dash/quote variants, then collapse extra spaces
+    # (split/join strips the ends too). For ASCII names the only table entries
+    # that can apply are the two quotes, and str.replace is ~10x cheaper than
+    # the per-character dict lookups of translate.
+    lowered = name.lower()
+    if lowered.isascii():
+        folded = lowered.replace("'", '').replace('"', '')
+    else:
+        folded = lowered.translate(_FOLD_TABLE)
+    normalized = ' '.join(folded.split())
 
-        # Remove common punctuation and extra spaces
-        normalized = re.sub(r'["\'''""„]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized)
+    # Handle "The" prefix
+    if normalized.startswith('the '):
+        normalized = normalized[4:]
 
-        # Handle "The" prefix
-        if normalized.startswith('the '):
-            normalized = normalized[4:]
+    return normalized
 
-        return normalized
 
-    def find_duplicates(self, artists: List[Dict]) -> Dict[str, List[Dict]]:
+class DuplicateDetector:
+    """Detects duplicate artists with various matching strategies."""
+
+    # Pattern to match numbered duplicates: "Artist (2)", "Artist (3)", etc.
+    # Unanchored; apply with fullmatch() so the whole name must match.
+    DUPLICATE_PATTERN = re.compile(r'(.+?)\s*\((\d+)\)')
+
+    # Normalize artist name for matching (the memoized module-level function)
+    normalize_name = staticmethod(_normalize_name)
+
+    def find_duplicates(self, artists: Iterable[Dict]) -> Dict[str, List[Dict]]:
         """
         Find duplicate artists using multiple strategies.
 
+        ``artists`` is consumed in a single pass, so any iterable (including a
+        generator yielding artists as they are received) can be passed.
+
         Returns:
             Dict mapping base names to lists of duplicate artists
         """
         safe_log("🔍 Analyzing artists for duplicates...")
 
-        # Group artists by normalized name
-        name_groups = defaultdict(list)
-        numbered_duplicates = {}
+        # Single pass keyed by normalized base name ("Artist (2)" -> "artist"):
+        # the first original (non-numbered) artist per key is kept, and every
+        # later artist with that key is recorded as its duplicate on the spot.
+        # Numbered artists seen before their original wait in pending; those
+        # whose original never appears are only deduplicated against each other
+        # after the pass. pending values are the bound list.append of each
+        # list, saving an attribute lookup per artist.
+        kept = {}
+        pending = defaultdict(lambda: [].append)
+        duplicates = {}
+
+        # Bind per-artist callables once instead of resolving them each iteration
+        duplicate_match = self.DUPLICATE_PATTERN.fullmatch
+        normalize = self.normalize_name
 
         for artist in artists:
             name = artist.get('artistName', '')
             if not name:
                 continue
 
+            # Count albums once for reporting (already done for streamed artists)
+            if '_album_count' not in artist:
+                artist['_album_count'] = len(artist.get('albums') or ())
+
             # Check if this is a numbered duplicate like "Artist (2)"
-            match = self.DUPLICATE_PATTERN.match(name)
+            match = duplicate_match(name)
             if match:
                 base_name = match.group(1).strip()
-                number = int(match.group(2))
-                normalized_base = self.normalize_name(base_name)
-
-                if normalized_base not in numbered_duplicates:
-                    numbered_duplicates[normalized_base] = {}
-
-                numbered_duplicates[normalized_base][number] = {
+                normalized = normalize(base_name)
+                dup = {
                     'artist': artist,
                     'original_name': name,
                     'base_name': base_name
                 }
 
-            # Also group by normalized name for general duplicate detection
-            normalized = self.normalize_name(name)
-            if normalized:
-                name_groups[normalized].append(artist)
+                original = kept.get(normalized)
+                if original is None:
+                    pending[normalized](dup)
+                else:
+                    duplicates.setdefault(original['artistName'], []).append(dup)
+                continue
 
-        # Find duplicates
-        duplicates = {}
+            normalized = normalize(name)
+            if not normalized:
+                continue
 
-        # Process numbered duplicates
-        for normalized_base, numbered_artists in numbered_duplicates.items():
-            # Look for the original (non-numbered) artist
-            original_candidates = [
-                artist for artist in artists
-                if self.normalize_name(artist.get('artistName', '')) == normalized_base
-                and not self.DUPLICATE_PATTERN.match(artist.get('artistName', ''))
-            ]
-
-            if original_candidates:
-                # We have both original and numbered duplicates
-                base_name = original_candidates[0]['artistName']
-                duplicates[base_name] = []
-
-                # Add all numbered duplicates to removal list
-                for number in sorted(numbered_artists.keys()):
-                    duplicates[base_name].append(numbered_artists[number])
-
-                safe_log(f"🎯 Found numbered duplicates for '{base_name}': {list(numbered_artists.keys())}")
-
-        # Also check for exact name duplicates (different from numbered ones)
-        for normalized, group in name_groups.items():
-            if len(group) > 1:
-                # Check if this isn't already handled by numbered duplicates
-                first_name = group[0].get('artistName', '')
-                if normalized not in duplicates and not any(
-                    self.normalize_name(dup_group[0]['artist']['artistName']) == normalized
-                    for dup_group in duplicates.values()
-                    for dup_artist in dup_group
-                ):
-                    # Keep the first one, mark others as duplicates
-                    base_name = first_name
-                    duplicates[base_name] = []
-                    for artist in group[1:]:
-                        duplicates[base_name].append({
-                            'artist': artist,
-                            'original_name': artist.get('artistName', ''),
-                            'base_name': base_name
-                        })
-                    safe_log(f"🎯 Found exact duplicates for '{base_name}': {len(group)-1} copies")
+            original = kept.setdefault(normalized, artist)
+            if original is artist:
+                # Numbered copies seen so far are duplicates of this original
+                waiting = pending.pop(normalized, None)
+                if waiting is not None:
+                    duplicates[name] = waiting.__self__
+            else:
+                # Exact name duplicate of the kept original
+                base_name = original['artistName']
+                duplicates.setdefault(base_name, []).append({
+                    'artist': artist,
+                    'original_name': name,
+                    'base_name': base_name
+                })
+
+        # No original for these: keep the first numbered artist with each full
+        # name, and treat identical copies of it ("Artist (2)" twice) as its
+        # exact name duplicates
+        for waiting in pending.values():
+            first_copies = {}
+            for dup in waiting.__self__:
+                first = first_copies.setdefault(normalize(dup['original_name']), dup)
+                if first is not dup:
+                    base_name = first['original_name']
+                    duplicates.setdefault(base_name, []).append({
+                        'artist': dup['artist'],
+                        'original_name': dup['original_name'],
+                        'base_name': base_name
+                    })
+
+        # Building each name list is skipped entirely when INFO is filtered out
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            for base_name, duplicate_list in duplicates.items():
+                safe_log("🎯 Found duplicates for '%s': %s",
+                         base_name, [dup['original_name'] for dup in duplicate_list])
+
+        # Names are only normalized during detection; release the memoized
+        # entries (one per unique name) instead of holding them for the run
+        _normalize_name.cache_clear()
 
         return duplicates
 
 
+# Display template for a single artist, filled by format_artist_info
+ARTIST_INFO_FORMAT = "{name} {monitored} ({albums} albums, ID: {id})"
+
+
+def _album_count(artist: Dict) -> int:
+    """Album count of an artist, precomputed by find_duplicates when available."""
+    if '_album_count' in artist:
+        return artist['_album_count']
+    return len(artist.get('albums') or ())
+
+
 def format_artist_info(artist: Dict) -> str:
     """Format artist information for display."""
-    name = artist.get('artistName', 'Unknown')
-    albums = len(artist.get('albums', []))
-    monitored = "👁️" if artist.get('monitored', False) else "👁️‍🗨️"
-
-    return f"{name} {monitored} ({albums} albums, ID: {artist.get('id', 'unknown')})"
+    return ARTIST_INFO_FORMAT.format_map({
+        'name': artist.get('artistName', 'Unknown'),
+        'monitored': "👁️" if artist.get('monitored', False) else "👁️‍🗨️",
+        'albums': _album_count(artist),
+        'id': artist.get('id', 'unknown')
+    })
 
 
 def display_duplicates_summary(duplicates: Dict[str, List[Dict]]) -> None:
@@ -228,29 +578,47 @@ def display_duplicates_summary(duplicates: Dict[str, List[Dict]]) -> None:
         return
 
     total_to_remove = sum(len(dupe_list) for dupe_list in duplicates.values())
-
-    safe_print(f"\n📊 DUPLICATE ANALYSIS RESULTS")
-    print(f"{'='*50}")
-    print(f"🎯 Found {len(duplicates)} base artists with duplicates")
-    safe_print(f"🗑️  Total duplicates to remove: {total_to_remove}")
-    print(f"💾 Artists that will be kept: {len(duplicates)}")
+    base_count = len(duplicates)
+
+    # Build the whole report and write it at once rather than one print per
+    # line, which is slow on Windows consoles
+    lines = []
+    add = lines.append
+    add(f"\n📊 DUPLICATE ANALYSIS RESULTS")
+    add(f"{'='*50}")
+    add(f"🎯 Found {base_count} base artists with duplicates")
+    add(f"🗑️  Total duplicates to remove: {total_to_remove}")
+    add(f"💾 Artists that will be kept: {base_count}")
 
     for base_name, duplicate_list in duplicates.items():
-        safe_print(f"\n🎵 {base_name}")
-        safe_print(f"   ✅ Will keep original")
-        safe_print(f"   🗑️  Will remove {len(duplicate_list)} duplicate(s):")
+        add(f"\n🎵 {base_name}")
+        add(f"   ✅ Will keep original")
+        add(f"   🗑️  Will remove {len(duplicate_list)} duplicate(s):")
 
         for i, dup in enumerate(duplicate_list, 1):
             artist = dup['artist']
-            albums = len(artist.get('albums', []))
             status = "monitored" if artist.get('monitored', False) else "unmonitored"
-            print(f"      {i}. {dup['original_name']} ({albums} albums, {status})")
+            add(f"      {i}. {dup['original_name']} ({_album_count(artist)} albums, {status})")
+
+    try:
+        sys.stdout.write('\n'.join(lines) + '\n')
+    except UnicodeEncodeError:
+        # Console can't encode emojis: fall back to per-line plain text
+        for line in lines:
+            safe_print(line)
 
 
-def cleanup_duplicates(api: LidarrAPI, duplicates: Dict[str, List[Dict]], dry_run: bool = True) -> Tuple[int, int]:
+def cleanup_duplicates(api: LidarrAPI, duplicates: Dict[str, List[Dict]], dry_run: bool = True,
+                       max_workers: int = 8, rate: float = 20) -> Tuple[int, int]:
     """
     Remove duplicate artists from Lidarr.
 
+    Duplicates are removed in batches of BULK_DELETE_BATCH_SIZE through the
+    artist editor endpoint. If Lidarr rejects a bulk request, the remaining
+    artists are deleted one by one, concurrently, by up to ``max_workers``
+    threads sharing the API session. All requests are paced by a token
+    bucket at ``rate`` requests per second so Lidarr is not overwhelmed.
+
     Returns:
         Tuple of (successful_removals, failed_removals)
     """
@@ -261,41 +629,81 @@ def cleanup_duplicates(api: LidarrAPI, duplicates: Dict[str, List[Dict]], dry_ru
     total_to_remove = sum(len(dupe_list) for dupe_list in duplicates.values())
 
     if dry_run:
-        safe_log(f"🧪 DRY RUN: Would remove {total_to_remove} duplicate artists")
+        safe_log("🧪 DRY RUN: Would remove %d duplicate artists", total_to_remove)
         return total_to_remove, 0
 
-    safe_log(f"🗑️  Starting cleanup of {total_to_remove} duplicate artists...")
+    safe_log("🗑️  Starting cleanup of %d duplicate artists...", total_to_remove)
 
     successful = 0
     failed = 0
+    jobs = []
 
     for base_name, duplicate_list in duplicates.items():
-        safe_log(f"🎵 Processing duplicates for: {base_name}")
+        safe_log("🎵 Processing duplicates for: %s", base_name)
 
         for dup in duplicate_list:
-            artist = dup['artist']
-            artist_id = artist.get('id')
+            artist_id = dup['artist'].get('id')
             artist_name = dup['original_name']
 
             if not artist_id:
-                safe_log(f"❌ No ID found for artist: {artist_name}", 'error')
+                safe_log("❌ No ID found for artist: %s", artist_name, level='error')
                 failed += 1
                 continue
 
-            safe_log(f"🗑️  Removing duplicate: {artist_name} (ID: {artist_id})")
+            jobs.append((artist_id, artist_name))
+
+    # The cached artist list is about to go stale; drop it before the first
+    # removal so even an interrupted run never reuses it
+    if jobs:
+        api.invalidate_artist_cache()
+
+    # Avoid overwhelming the API
+    limiter = RateLimiter(rate=rate)
+
+    # Delete the duplicates (don't delete files, add to import exclusion)
+    fallback_jobs = []
+    for start in range(0, len(jobs), BULK_DELETE_BATCH_SIZE):
+        batch = jobs[start:start + BULK_DELETE_BATCH_SIZE]
+
+        # Announce each artist once, whichever way it ends up being removed
+        for artist_id, artist_name in batch:
+            safe_log("🗑️  Removing duplicate: %s (ID: %s)", artist_name, artist_id)
+
+        # Once a bulk request has failed, stop trying the endpoint
+        if fallback_jobs:
+            fallback_jobs.extend(batch)
+            continue
+
+        limiter.acquire()
+        if api.delete_artists_bulk([artist_id for artist_id, _ in batch],
+                                   delete_files=False, add_import_exclusion=True):
+            for _, artist_name in batch:
+                safe_log("✅ Successfully removed: %s", artist_name)
+            successful += len(batch)
+        else:
+            safe_log("⚠️  Bulk removal failed, removing remaining artists one at a time", level='warning')
+            fallback_jobs.extend(batch)
+
+    def remove(artist_id: int, artist_name: str) -> bool:
+        limiter.acquire()
+        return api.delete_artist(artist_id, delete_files=False, add_import_exclusion=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(remove, artist_id, artist_name): artist_name
+            for artist_id, artist_name in fallback_jobs
+        }
 
-            # Delete the duplicate (don't delete files, add to import exclusion)
-            if api.delete_artist(artist_id, delete_files=False, add_import_exclusion=True):
-                safe_log(f"✅ Successfully removed: {artist_name}")
+        for future in as_completed(futures):
+            artist_name = futures[future]
+            if future.result():
+                safe_log("✅ Successfully removed: %s", artist_name)
                 successful += 1
             else:
-                safe_log(f"❌ Failed to remove: {artist_name}", 'error')
+                safe_log("❌ Failed to remove: %s", artist_name, level='error')
                 failed += 1
 
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.5)
-
-    safe_log(f"🏁 Cleanup complete: {successful} removed, {failed} failed")
+    safe_log("🏁 Cleanup complete: %d removed, %d failed", successful, failed)
     return successful, failed
 
 
@@ -334,7 +742,7 @@ def load_env_file(env_path: str = None) -> None:
                         os.environ[key] = value
 
     except Exception as e:
-        logging.warning(f"Failed to load .env file: {e}")
+        logging.warning("Failed to load .env file: %s", e)
 
 
 def safe_print(message: str) -> None:
@@ -350,14 +758,20 @@ def safe_print(message: str) -> None:
             print(clean_message)
 
 
-def safe_log(message: str, level: str = 'info') -> None:
-    """Log message with Windows-compatible encoding."""
+def safe_log(message: str, *args, level: str = 'info') -> None:
+    """Log message with Windows-compatible encoding.
+
+    ``args`` are %-formatted into ``message`` by logging itself, and only if
+    the record is actually emitted.
+    """
     try:
         # Try to log with emojis
-        getattr(logging, level)(message)
+        getattr(logging, level)(message, *args)
     except UnicodeEncodeError:
         # Fallback: remove emojis and log plain text
         import re
+        if args:
+            message = message % args
         clean_message = re.sub(r'[^\x00-\x7F]+', '', message).strip()
         clean_message = re.sub(r'\s+', ' ', clean_message)  # Clean up extra spaces
         if clean_message:
@@ -428,6 +842,35 @@ Examples:
         help='Enable verbose debug logging'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Threads removing duplicates one at a time when Lidarr rejects bulk removal (default: 8)'
+    )
+
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=20,
+        help=f'Maximum removal requests per second sent to Lidarr; each bulk request removes '
+             f'up to {BULK_DELETE_BATCH_SIZE} artists (default: 20)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Always download the full artist list instead of revalidating the copy cached in {ARTIST_CACHE_DIR}'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=60,
+        help='In --dry-run mode, reuse a cached artist list this many seconds old or newer '
+             'without contacting Lidarr (default: 60, 0 to always revalidate)'
+    )
+
     parser.add_argument(
         '--auto-confirm',
         action='store_true',
@@ -452,6 +895,14 @@ Examples:
         safe_print("❌ Error: Lidarr API key not provided. Use --api-key or set LIDARR_API_KEY environment variable.")
         return 1
 
+    if args.workers < 1:
+        safe_print("❌ Error: --workers must be at least 1.")
+        return 1
+
+    if args.rate <= 0:
+        safe_print("❌ Error: --rate must be greater than 0.")
+        return 1
+
     # Setup logging
     setup_logging(args.verbose)
 
@@ -462,7 +913,8 @@ Examples:
     print("=" * 45)
 
     # Initialize API client
-    api = LidarrAPI(url, api_key)
+    api = LidarrAPI(url, api_key, cache_dir=None if args.no_cache else ARTIST_CACHE_DIR,
+                    pool_size=max(args.workers, 16))
 
     # Test connection
     if not api.test_connection():
@@ -470,16 +922,17 @@ Examples:
         return 1
 
     try:
-        # Get all artists
-        artists = api.get_artists()
+        # Stream all artists straight into detection
+        artists = api.iter_artists(max_age=args.cache_ttl if args.dry_run else None)
+        first = next(artists, None)
 
-        if not artists:
+        if first is None:
             safe_print("ℹ️  No artists found in Lidarr.")
             return 0
 
         # Detect duplicates
         detector = DuplicateDetector()
-        duplicates = detector.find_duplicates(artists)
+        duplicates = detector.find_duplicates(itertools.chain((first,), artists))
 
         # Display summary
         display_duplicates_summary(duplicates)
@@ -499,7 +952,8 @@ Examples:
                 return 0
 
         # Perform cleanup
-        successful, failed = cleanup_duplicates(api, duplicates, dry_run=args.dry_run)
+        successful, failed = cleanup_duplicates(api, duplicates, dry_run=args.dry_run,
+                                                max_workers=args.workers, rate=args.rate)
 
         # Final summary
         if args.dry_run:
@@ -515,7 +969,7 @@ Examples:
         return 0 if failed == 0 else 1
 
     except Exception as e:
-        safe_log(f"❌ Script failed with error: {e}", 'error')
+        safe_log("❌ Script failed with error: %s", e, level='error')
         if args.verbose:
             logging.exception("Full error details:")
         return 1
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
+import base64
+import http.client
 import json
 import os
 import sys
+import threading
+import time
 import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urljoin, urlsplit
 
 OWNER = os.environ.get("OWNER", "RicherTunes")
 REPO = os.environ.get("REPO", "Brainarr")
@@ -12,33 +17,126 @@ TOKEN = os.environ.get("GITHUB_TOKEN")
 
 API = "https://api.github.com"
 
+# Retry policy: 429 means the request was rejected unprocessed, so any method
+# may retry it; other transient 5xx responses are only retried for GET. Other
+# methods only retry network errors that happen before the server could have
+# acted on the request (see _send).
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# GET follows redirects, as urllib.request.urlopen did
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Keep-alive connections, one per thread and host
+_local = threading.local()
+
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
+def _proxy_for(scheme, host):
+    # Same proxy settings urllib.request uses (http_proxy/https_proxy/no_proxy)
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+def _connection(scheme, host):
+    # Returns (connection, forward_headers). forward_headers is None unless
+    # plain HTTP goes through a proxy, in which case requests name the
+    # absolute URL and carry these extra headers. HTTPS is tunneled instead.
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    entry = conns.get((scheme, host))
+    if entry is None:
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        proxy = _proxy_for(scheme, host)
+        if proxy is None:
+            entry = (conn_cls(host, timeout=60), None)
+        else:
+            proxy_parts = urlsplit(proxy)
+            proxy_headers = {}
+            if proxy_parts.username:
+                creds = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+                proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+            conn = conn_cls(proxy_parts.netloc.rpartition("@")[2], timeout=60)
+            if scheme == "https":
+                conn.set_tunnel(host, headers=proxy_headers)
+                entry = (conn, None)
+            else:
+                entry = (conn, proxy_headers)
+        conns[(scheme, host)] = entry
+    return entry
+
+def _retry_delay(resp, attempt):
+    retry_after = resp.getheader("Retry-After") if resp is not None else None
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    return BACKOFF_FACTOR * (2 ** attempt)
+
+def _send(method, url, data, headers):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    for attempt in range(MAX_RETRIES + 1):
+        conn, forward_headers = _connection(parts.scheme, parts.netloc)
+        if forward_headers is None:
+            target, request_headers = path, headers
+        else:
+            target, request_headers = url, {**headers, **forward_headers}
+        sent = False
+        try:
+            conn.request(method, target, body=data, headers=request_headers)
+            sent = True
+            resp = conn.getresponse()
+            content = resp.read().decode("utf-8")
+        except (http.client.HTTPException, OSError) as e:
+            # Drop the connection so the next attempt reconnects. Only GET
+            # retries any failure: other methods retry only if the request
+            # could not have been processed, i.e. it failed to send, or a stale
+            # keep-alive connection closed before any response byte arrived
+            # (RemoteDisconnected). A failure while reading a response may
+            # follow a processed POST, and retrying it would repeat the POST.
+            conn.close()
+            unprocessed = isinstance(e, ConnectionError) and (
+                not sent or isinstance(e, http.client.RemoteDisconnected))
+            if attempt == MAX_RETRIES or not (method == "GET" or unprocessed):
+                raise RuntimeError(f"Network error contacting {url}: {e}")
+            time.sleep(_retry_delay(None, attempt))
+            continue
+        retryable = resp.status == 429 or (method == "GET" and resp.status in RETRY_STATUSES)
+        if not retryable or attempt == MAX_RETRIES:
+            break
+        time.sleep(_retry_delay(resp, attempt))
+    return resp, content
+
 def http_request(method, url, body=None, headers=None):
     data = None
     if body is not None:
         if not isinstance(body, (bytes, bytearray)):
             body = json.dumps(body).encode("utf-8")
         data = body
-    req = urllib.request.Request(url=url, data=data, method=method)
-    for k, v in (headers or {}).items():
-        req.add_header(k, v)
+    headers = dict(headers or {})
+    for _ in range(MAX_REDIRECTS + 1):
+        resp, content = _send(method, url, data, headers)
+        location = resp.getheader("Location")
+        if method != "GET" or resp.status not in REDIRECT_STATUSES or not location:
+            break
+        next_url = urljoin(url, location)
+        # Never hand the token to a different host
+        if urlsplit(next_url).netloc != urlsplit(url).netloc:
+            headers.pop("Authorization", None)
+        url = next_url
+    if resp.status < 400:
+        if content:
+            return resp.status, json.loads(content)
+        return resp.status, None
     try:
-        with urllib.request.urlopen(req) as resp:
-            content = resp.read().decode("utf-8")
-            if content:
-                return resp.getcode(), json.loads(content)
-            return resp.getcode(), None
-    except urllib.error.HTTPError as e:
-        content = e.read().decode("utf-8") if e.fp else ""
-        try:
-            payload = json.loads(content) if content else None
-        except Exception:
-            payload = {"raw": content}
-        return e.code, payload
-    except urllib.error.URLError as e:
-        raise RuntimeError(f"Network error contacting {url}: {e}")
+        payload = json.loads(content) if content else None
+    except Exception:
+        payload = {"raw": content}
+    return resp.status, payload
 
 def rest_headers():
     return {
@@ -67,6 +165,9 @@ def ensure_label(name, color, description):
         {"name": name, "color": color, "description": description},
         rest_headers(),
     )
+    return code
+
+def report_label(name, code):
     if code == 201:
         print(f"Created label: {name}")
     elif code == 422:
@@ -97,13 +198,23 @@ def get_user_project_id(login, number):
     except Exception:
         raise RuntimeError(f"Could not resolve Project v2 ID: {data}")
 
-def add_issue_to_project(project_id, issue_node_id):
-    m = (
-        "mutation($projectId: ID!, $contentId: ID!) {\n"
-        "  addProjectV2ItemById(input: { projectId: $projectId, contentId: $contentId }) { item { id } }\n"
-        "}"
+def add_issues_to_project(project_id, issue_node_ids):
+    # One aliased addProjectV2ItemById per issue, sent as a single mutation.
+    # Failed additions are reported under "errors" with HTTP 200, so count the
+    # aliases that succeeded and return that number.
+    params = "".join(f", $c{i}: ID!" for i in range(len(issue_node_ids)))
+    fields = "".join(
+        f"  a{i}: addProjectV2ItemById(input: {{ projectId: $projectId, contentId: $c{i} }}) {{ item {{ id }} }}\n"
+        for i in range(len(issue_node_ids))
     )
-    gh_graphql(m, {"projectId": project_id, "contentId": issue_node_id})
+    m = f"mutation($projectId: ID!{params}) {{\n{fields}}}"
+    variables = {"projectId": project_id}
+    variables.update((f"c{i}", node) for i, node in enumerate(issue_node_ids))
+    data = gh_graphql(m, variables)
+    for err in data.get("errors") or ():
+        eprint(f"Failed to add issue to Project: {err.get('message', err)}")
+    added = data.get("data") or {}
+    return sum(1 for i in range(len(issue_node_ids)) if added.get(f"a{i}"))
 
 def main():
     global OWNER, REPO, PROJECT_NUMBER, TOKEN
@@ -137,14 +248,26 @@ def main():
     except Exception as e:
         eprint(str(e)); return 1
 
-    print("==> Ensuring base labels")
-    ensure_label("ci", "1d76db", "Continuous Integration")
-    ensure_label("task", "d4c5f9", "General engineering task/chore")
-    ensure_label("documentation", "0075ca", "Documentation changes")
-    ensure_label("needs-triage", "fbca04", "Needs initial triage")
+    base_labels = [
+        ("ci", "1d76db", "Continuous Integration"),
+        ("task", "d4c5f9", "General engineering task/chore"),
+        ("documentation", "0075ca", "Documentation changes"),
+        ("needs-triage", "fbca04", "Needs initial triage"),
+    ]
+
+    # The project lookup is a read-only query, so it runs in the background
+    # while labels and issues are created. Creation itself stays sequential:
+    # GitHub asks for content-creating requests to be serial, and it keeps
+    # issue numbers in the order listed.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        project_future = ex.submit(get_user_project_id, OWNER, PROJECT_NUMBER)
 
-    print(f"==> Resolving Project v2 ID for {OWNER} #{PROJECT_NUMBER}")
-    project_id = get_user_project_id(OWNER, PROJECT_NUMBER)
+        print("==> Ensuring base labels")
+        for name, color, description in base_labels:
+            report_label(name, ensure_label(name, color, description))
+
+        print(f"==> Resolving Project v2 ID for {OWNER} #{PROJECT_NUMBER}")
+        project_id = project_future.result()
 
     issues = [
         (
@@ -233,15 +356,21 @@ Acceptance
     ]
 
     print("==> Creating issues and adding to Project")
-    for title, labels, body in issues:
-        resp = new_issue(title, labels, body)
-        num = resp.get("number")
-        node = resp.get("node_id")
-        url = resp.get("html_url")
-        print(f"Created issue #{num}: {url}")
-        if node:
-            add_issue_to_project(project_id, node)
-            print("  ↳ Added to Project")
+    nodes = []
+    try:
+        for title, labels, body in issues:
+            resp = new_issue(title, labels, body)
+            num = resp.get("number")
+            node = resp.get("node_id")
+            url = resp.get("html_url")
+            print(f"Created issue #{num}: {url}")
+            if node:
+                nodes.append(node)
+    finally:
+        # Issues created before a failure are still added to the Project
+        if nodes:
+            added = add_issues_to_project(project_id, nodes)
+            print(f"  ↳ Added {added} of {len(nodes)} issues to Project")
 
     print("==> Done")
     return 0